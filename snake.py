@@ -11,24 +11,99 @@ The program is intentionally simple so you can read it line by line and tweak it
 # Imports & constants
 # --------------------------------------------------------------------------- #
 import pygame
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 import random
 import os
 import json
-import socket
+import time
+
+# Optional: numpy speeds up the full-board redraw
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: SNAKE_RENDERER=gpu draws through SDL2's hardware Renderer/Texture API
+# (pygame._sdl2, still experimental). Falls back to the software surface path.
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    Renderer = None
 
 # Window size (pixels)
 WINDOW_W = 640          # width
 WINDOW_H = 480          # height
 CELL_SIZE = 20           # size of one snake “cell” in pixels
 
+# Board size (cells)
+ROWS = WINDOW_H // CELL_SIZE
+COLS = WINDOW_W // CELL_SIZE
+
 # Frames per second – how fast the game runs
 FPS = 15
 
+# Score display, top-score persistence and the game-over name prompt.
+# Set SNAKE_HIGHSCORE=0 to play without them.
+HIGHSCORE_ENABLED = os.environ.get("SNAKE_HIGHSCORE", "1") != "0"
+
+GPU_RENDERER = os.environ.get("SNAKE_RENDERER") == "gpu" and Renderer is not None
+
+# Headless / benchmark mode (SNAKE_HEADLESS=1): no window, no vsync, no frame cap
+# and no game-over prompt, so the loop runs as fast as the game logic allows.
+# It stops after SNAKE_HEADLESS_TICKS ticks and prints the tick rate.
+HEADLESS = os.environ.get("SNAKE_HEADLESS", "0") != "0"
+HEADLESS_TICKS = int(os.environ.get("SNAKE_HEADLESS_TICKS", "10000"))
+if HEADLESS:
+    # must be set before pygame.init()
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_RENDER_VSYNC"] = "0"
+    os.environ["SDL_RENDER_SCALE_QUALITY"] = "0"
+
+# Timer event that blinks the cursor on the game-over name prompt
+CURSOR_EVENT = pygame.USEREVENT + 1
+
 # --------------------------------------------------------------------------- #
 # Helper types
 # --------------------------------------------------------------------------- #
-Position = Tuple[int, int]   # (row, col) – row is y, col is x
+Position = int               # packed cell index row * COLS + col – row is y, col is x
+
+
+def enc(r: int, c: int) -> Position:
+    """Pack (row, col) into a single cell index."""
+    return r * COLS + c
+
+
+def dec(x: Position) -> Tuple[int, int]:
+    """Unpack a cell index into (row, col)."""
+    return divmod(x, COLS)
+
+# Arrow key -> direction (dy, dx), and each direction's opposite
+_KEY_TO_DIR = {
+    pygame.K_UP: (-1, 0),
+    pygame.K_DOWN: (1, 0),
+    pygame.K_LEFT: (0, -1),
+    pygame.K_RIGHT: (0, 1),
+}
+_OPPOSITE = {(-1, 0): (1, 0), (1, 0): (-1, 0), (0, -1): (0, 1), (0, 1): (0, -1)}
+
+
+# --------------------------------------------------------------------------- #
+# Game logic step
+# --------------------------------------------------------------------------- #
+def step(hr, hc, dr, dc, rows, cols, occ):
+    """Move the head at (hr, hc) one cell in direction (dr, dc) with wrap-around.
+
+    occ is the rows*cols occupancy bitmap (1 where the snake is). Returns the
+    new head row, column, cell index and whether it lands on an occupied cell.
+    """
+    # Steps are ±1, so wrapping only ever needs one compare per axis
+    nr = hr + dr
+    nr = 0 if nr == rows else (rows - 1 if nr < 0 else nr)
+    nc = hc + dc
+    nc = 0 if nc == cols else (cols - 1 if nc < 0 else nc)
+    new_head = nr * cols + nc
+    return nr, nc, new_head, occ[new_head] != 0
 
 # --------------------------------------------------------------------------- #
 # Game state
@@ -39,26 +114,90 @@ class SnakeGame:
     """
 
     def __init__(self):
+        if GPU_RENDERER:
+            # Let SDL coalesce consecutive same-texture copies into one GPU draw call
+            os.environ.setdefault("SDL_RENDER_BATCHING", "1")
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_W, WINDOW_H))
-        pygame.display.set_caption("Snake – Python Edition")
+        if GPU_RENDERER:
+            # Gameplay is drawn with textures; self.screen is an off-screen canvas
+            # for the pause overlay and the game-over prompt.
+            self.window = Window("Snake – Python Edition", size=(WINDOW_W, WINDOW_H))
+            self.renderer = Renderer(self.window)
+            self.screen = pygame.Surface((WINDOW_W, WINDOW_H))
+        else:
+            self.renderer = None
+            self.screen = pygame.display.set_mode((WINDOW_W, WINDOW_H))
+            pygame.display.set_caption("Snake – Python Edition")
         self.clock = pygame.time.Clock()
-        # The snake is a list of positions (row, col)
+        # The snake is a deque of cell indices, tail first – both ends are O(1)
         # start somewhere near the middle
-        start_r = (WINDOW_H // CELL_SIZE) // 2
-        start_c = (WINDOW_W // CELL_SIZE) // 2 - 1
-        self.snake: List[Position] = [(start_r, start_c), (start_r, start_c + 1), (start_r, start_c + 2)]
-        self.direction: Position = (0, 1)   # moving right initially (dy, dx)
-        self.food: Position | None = None
+        start_r = ROWS // 2
+        start_c = COLS // 2 - 1
+        self.snake: Deque[Position] = deque([enc(start_r, start_c), enc(start_r, start_c + 1), enc(start_r, start_c + 2)])
+        # Row/col of self.snake[-1], kept alongside so moving the head needs no divmod
+        self.head_r, self.head_c = start_r, start_c + 2
+        # Bitmap of the cells covered by the snake, kept in lockstep with
+        # self.snake for O(1) lookups
+        self.occupied = bytearray(ROWS * COLS)
+        for cell in self.snake:
+            self.occupied[cell] = 1
+        # Free cells as a list (for O(1) random picks) plus each cell's index in
+        # that list (for O(1) swap-removal when the snake moves onto it)
+        self._free_list: List[Position] = [cell for cell in range(ROWS * COLS) if not self.occupied[cell]]
+        self._free_index: List[int] = [0] * (ROWS * COLS)
+        for i, cell in enumerate(self._free_list):
+            self._free_index[cell] = i
+        self.direction: Tuple[int, int] = (0, 1)   # moving right initially (dy, dx)
+        self.food: Position | None = None   # cell index – 0 is a valid cell, compare with None
 
         # scoring
         self.score = 0
+        # absolute, so it still points next to this script after an os.chdir()
+        self._highscore_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "highscore.json")
         # load top score (name and score)
-        self.highscore_name, self.highscore_score = self.load_highscore()
+        if HIGHSCORE_ENABLED:
+            self.highscore_name, self.highscore_score = self.load_highscore()
+        else:
+            self.highscore_name, self.highscore_score = "---", 0
 
         # font for score display
         self.font = pygame.font.SysFont(None, 28)
 
+        # Pre-filled cell surfaces so a whole snake can be drawn with one blits() call.
+        # convert() matches the display's pixel format so each blit is a plain copy.
+        self._cell_surf = self.native(pygame.Surface((CELL_SIZE, CELL_SIZE)))
+        self._cell_surf.fill((0, 255, 0))                # green
+        self._food_surf = self.native(pygame.Surface((CELL_SIZE, CELL_SIZE)))
+        self._food_surf.fill((255, 0, 0))                # red
+        # Pixel position and Rect of every board cell, built once instead of per frame
+        self._positions = [(c * CELL_SIZE, r * CELL_SIZE) for r in range(ROWS) for c in range(COLS)]
+        self._rects = [pygame.Rect(x, y, CELL_SIZE, CELL_SIZE) for x, y in self._positions]
+
+        if np is not None:
+            # Board image for full redraws (surfarray is indexed [x, y], i.e. [col, row])
+            self._board = np.zeros((COLS, ROWS, 3), dtype=np.uint8)
+            # zero-copy (row, col) view of the occupancy bitmap
+            self._occupied_grid = np.frombuffer(self.occupied, dtype=np.uint8).reshape(ROWS, COLS)
+            self._board_surf = self.native(pygame.Surface((COLS, ROWS)))
+
+        if self.renderer is not None:
+            self.snake_tex = Texture.from_surface(self.renderer, self._cell_surf)
+            self.food_tex = Texture.from_surface(self.renderer, self._food_surf)
+
+        # Dirty-rect bookkeeping: the first frame (and the one after a pause)
+        # repaints everything, later frames only touch the cells that changed.
+        self._full_redraw = True
+        self._score_rect = pygame.Rect(0, 0, 0, 0)
+        self._top_rect = pygame.Rect(0, 0, 0, 0)
+
+        # Rendered text is cached and only re-rendered when the value it shows changes
+        self._score_surf = None
+        self._score_surf_for = -1
+        self._top_surf = None
+        self._top_surf_for = None
+        self._pause_surf = self.native(self.font.render("PAUSED - press p to resume", True, (255, 255, 255)), alpha=True)
+        self._pause_rect = self._pause_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2))
+
         # Timing for the food spawn
         self.spawn_food()
         # speed mode: ('Easy','Normal','Hard') -> fps
@@ -71,12 +210,23 @@ class SnakeGame:
     # --------------------------------------------------------------------- #
     def spawn_food(self):
         """Place a new piece of food at a random empty cell."""
-        while True:
-            r = random.randint(0, WINDOW_H // CELL_SIZE - 1)
-            c = random.randint(0, WINDOW_W // CELL_SIZE - 1)
-            if (r, c) not in self.snake:          # avoid collision with snake
-                self.food = (r, c)
-                break
+        if self._free_list:
+            self.food = self._free_list[random.randrange(len(self._free_list))]
+        else:
+            self.food = None                      # the snake fills the whole board
+
+    def take_cell(self, pos: Position):
+        """Remove pos from the free-cell list (swap with the last entry, then pop)."""
+        i = self._free_index[pos]
+        last = self._free_list.pop()
+        if last != pos:
+            self._free_list[i] = last
+            self._free_index[last] = i
+
+    def release_cell(self, pos: Position):
+        """Put pos back into the free-cell list."""
+        self._free_index[pos] = len(self._free_list)
+        self._free_list.append(pos)
 
     # --------------------------------------------------------------------- #
     # Main loop – runs until the user quits
@@ -85,6 +235,8 @@ class SnakeGame:
         """Main game loop."""
         running = True
         paused = False
+        ticks = 0
+        start = time.perf_counter()
         while running:
             # 1. Handle events
             for event in pygame.event.get():
@@ -108,111 +260,251 @@ class SnakeGame:
                         self.speed_mode = "Hard"
                         self.current_fps = self.speed_modes[self.speed_mode]
 
-                    if event.key == pygame.K_UP:
-                        new_dir = (-1, 0)
-                    elif event.key == pygame.K_DOWN:
-                        new_dir = (1, 0)
-                    elif event.key == pygame.K_LEFT:
-                        new_dir = (0, -1)
-                    elif event.key == pygame.K_RIGHT:
-                        new_dir = (0, 1)
-                    else:
-                        new_dir = None
-
                     # Prevent reversing into itself: new_dir must not be opposite of current
-                    if new_dir:
-                        if (new_dir[0] + self.direction[0], new_dir[1] + self.direction[1]) != (0, 0):
-                            self.direction = new_dir
+                    new_dir = _KEY_TO_DIR.get(event.key)
+                    if new_dir and _OPPOSITE[new_dir] != self.direction:
+                        self.direction = new_dir
 
             # If paused, skip update/draw except show paused indicator
             if paused:
-                self.draw()
+                self.draw_board()
+                # the overlay covers the board, so repaint it all once we resume
+                self._full_redraw = True
                 # Draw paused overlay
-                pause_surf = self.font.render("PAUSED - press p to resume", True, (255, 255, 255))
-                pause_rect = pause_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2))
-                self.screen.blit(pause_surf, pause_rect)
-                pygame.display.flip()
+                self.screen.blit(self._pause_surf, self._pause_rect)
+                self.present_screen()
                 self.clock.tick(10)
                 continue
 
             # 2. Update snake position
             # Calculate new head position with wrap-around (toroidal board)
-            rows = WINDOW_H // CELL_SIZE
-            cols = WINDOW_W // CELL_SIZE
-            new_r = (self.snake[-1][0] + self.direction[0]) % rows
-            new_c = (self.snake[-1][1] + self.direction[1]) % cols
-            new_head = (new_r, new_c)
+            new_r, new_c, new_head, hit = step(self.head_r, self.head_c, self.direction[0], self.direction[1],
+                                               ROWS, COLS, self.occupied)
+
+            # 3. Check if we hit the food
+            eating = new_head == self.food
 
             # Check collision with self (game over). For simplicity, stop the game.
-            if new_head in self.snake:
+            # The tail cell is safe: it moves out of the way this tick (we can't be
+            # eating there, food never spawns on the snake).
+            if hit and new_head != self.snake[0]:
                 running = False
                 continue
 
+            old_tail = None
+            if not eating:
+                # Not eating — remove tail so the snake appears to move
+                old_tail = self.snake.popleft()
+                self.occupied[old_tail] = 0
+                self.release_cell(old_tail)
+
             # Add new head
             self.snake.append(new_head)
+            self.head_r, self.head_c = new_r, new_c
+            self.occupied[new_head] = 1
+            self.take_cell(new_head)
 
-            # 3. Check if we hit the food
-            if self.food and new_head == self.food:
-                # eating: increase score and spawn new food (don't remove tail)
+            food_changed = False
+            if eating:
+                # eating: increase score and spawn new food (tail was kept)
                 self.score += 1
                 self.spawn_food()
-            else:
-                # Not eating — remove tail so the snake appears to move
-                self.snake.pop(0)
+                food_changed = True
 
-            # 4. Draw everything
-            self.draw()
+            # 4. Draw what changed & refresh screen
+            self.draw(old_tail, new_head, food_changed)
 
-            # 5. Refresh screen & tick
-            pygame.display.flip()
-            self.clock.tick(self.current_fps)
+            # 5. Tick
+            ticks += 1
+            if not HEADLESS:
+                self.clock.tick(self.current_fps)
+            elif ticks >= HEADLESS_TICKS:
+                running = False
+
+        if HEADLESS:
+            elapsed = time.perf_counter() - start
+            print(f"{ticks} ticks in {elapsed:.2f} s ({ticks / elapsed:.0f} ticks/s)")
 
         # when the main loop ends, handle game over (username prompt & highscore)
-        self.handle_game_over()
+        if HIGHSCORE_ENABLED and not HEADLESS:
+            self.handle_game_over()
 
     # --------------------------------------------------------------------- #
     # Drawing routine – called every frame
     # --------------------------------------------------------------------- #
-    def draw(self):
+    def draw(self, dirty_tail: Optional[Position] = None, dirty_head: Optional[Position] = None,
+             food_changed: bool = False):
+        """Draw the cells that changed this tick and push only those to the display."""
+        if self.renderer is not None:
+            self.draw_gpu()
+            return
+        if self._full_redraw or dirty_head is None:
+            self.draw_board()
+            if not HEADLESS:
+                pygame.display.flip()
+            self._full_redraw = False
+            return
+
+        dirty = []
+
+        # Erase the cell the tail just left
+        if dirty_tail is not None:
+            tail_rect = self.cell_rect(dirty_tail)
+            self.screen.fill((0, 0, 0), tail_rect)
+            dirty.append(tail_rect)
+
+        # Draw the new head (and the freshly spawned food)
+        head_rect = self.cell_rect(dirty_head)
+        self.screen.blit(self._cell_surf, head_rect)
+        dirty.append(head_rect)
+        if food_changed and self.food is not None:
+            food_rect = self.cell_rect(self.food)
+            self.screen.blit(self._food_surf, food_rect)
+            dirty.append(food_rect)
+
+        # Text is drawn on top of the board, so re-blit it when it changed or
+        # when one of the cells above was painted underneath it
+        if HIGHSCORE_ENABLED:
+            hs = (self.highscore_name, self.highscore_score)
+            if self.score != self._score_surf_for or hs != self._top_surf_for:
+                old_rects = (self._score_rect, self._top_rect)
+                for old in old_rects:
+                    self.redraw_area(old)
+                self.draw_scores()
+                for old, new in zip(old_rects, (self._score_rect, self._top_rect)):
+                    dirty.append(old.union(new))
+            elif any(self._score_rect.colliderect(rect) or self._top_rect.colliderect(rect) for rect in dirty):
+                # clear first – blitting alpha text over itself darkens its edges
+                self.redraw_area(self._score_rect)
+                self.redraw_area(self._top_rect)
+                self.draw_scores()
+                dirty.extend((self._score_rect, self._top_rect))
+
+        if not HEADLESS:
+            pygame.display.update(dirty)
+
+    def draw_gpu(self):
+        """Draw the whole game state with the hardware renderer."""
+        renderer = self.renderer
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+
+        # All snake cells share one texture and are issued back to back, so SDL's
+        # render batching submits them together
+        snake_tex = self.snake_tex
+        rects = self._rects
+        for cell in self.snake:
+            snake_tex.draw(dstrect=rects[cell])
+        if self.food is not None:
+            self.food_tex.draw(dstrect=self.cell_rect(self.food))
+
+        if HIGHSCORE_ENABLED:
+            self.render_scores()
+            self._score_tex.draw(dstrect=self._score_rect)
+            self._top_tex.draw(dstrect=self._top_rect)
+
+        if not HEADLESS:
+            renderer.present()
+
+    def present_screen(self):
+        """Show the whole of self.screen (used for the pause and game-over screens)."""
+        if HEADLESS:
+            return
+        if self.renderer is not None:
+            Texture.from_surface(self.renderer, self.screen).draw()
+            self.renderer.present()
+        else:
+            pygame.display.flip()
+
+    def native(self, surf: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+        """Convert surf to the display's pixel format (GPU textures don't need it)."""
+        if self.renderer is not None:
+            return surf
+        return surf.convert_alpha() if alpha else surf.convert()
+
+    def draw_board(self):
         """Draw the whole game state to the screen."""
-        # Clear background
-        self.screen.fill((0, 0, 0))          # black
-
-        # Draw snake
-        for r, c in self.snake:
-            pygame.draw.rect(
-                self.screen,
-                (0, 255, 0),                     # green
-                pygame.Rect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+        if np is not None:
+            # One pixel per cell in a tiny (col, row) image, scaled up to the whole
+            # window in a single call – this also clears the background
+            board = self._board
+            board.fill(0)
+            board[self._occupied_grid.T != 0] = (0, 255, 0)                   # green
+            if self.food is not None:
+                food_r, food_c = dec(self.food)
+                board[food_c, food_r] = (255, 0, 0)                           # red
+            pygame.surfarray.blit_array(self._board_surf, board)
+            pygame.transform.scale(self._board_surf, (WINDOW_W, WINDOW_H), self.screen)
+        else:
+            # Clear background
+            self.screen.fill((0, 0, 0))          # black
+
+            # Draw snake – every segment in a single batched blit
+            cell = self._cell_surf
+            positions = self._positions
+            self.screen.blits(
+                [(cell, positions[i]) for i in self.snake],
+                doreturn=0
             )
 
-        # Draw food
-        if self.food:
-            pygame.draw.rect(
-                self.screen,
-                (255, 0, 0),                     # red
-                # draw food as single cell same size as snake
-                pygame.Rect(self.food[1] * CELL_SIZE, self.food[0] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
+            # Draw food as single cell same size as snake
+            if self.food is not None:
+                self.screen.blit(self._food_surf, self._positions[self.food])
+
+        self.draw_scores()
+
+    def draw_scores(self):
+        """Draw the current score (top-middle) and the top score (top-right)."""
+        if not HIGHSCORE_ENABLED:
+            return
+        self.render_scores()
+        self.screen.blit(self._score_surf, self._score_rect)
+        self.screen.blit(self._top_surf, self._top_rect)
+
+    def render_scores(self):
+        """Re-render the score texts whose value changed since they were last rendered."""
+        if self._score_surf_for != self.score:
+            self._score_surf = self.native(self.font.render(f"Score: {self.score}", True, (255, 255, 255)), alpha=True)
+            self._score_rect = self._score_surf.get_rect()
+            self._score_rect.midtop = (WINDOW_W // 2, 6)
+            self._score_surf_for = self.score
+            if self.renderer is not None:
+                self._score_tex = Texture.from_surface(self.renderer, self._score_surf)
+
+        hs = (self.highscore_name, self.highscore_score)
+        if self._top_surf_for != hs:
+            self._top_surf = self.native(
+                self.font.render(f"Top: {self.highscore_name} {self.highscore_score}", True, (255, 255, 0)), alpha=True
             )
-
-        # Draw current score at top-middle
-        score_surf = self.font.render(f"Score: {self.score}", True, (255, 255, 255))
-        score_rect = score_surf.get_rect()
-        score_rect.midtop = (WINDOW_W // 2, 6)
-        self.screen.blit(score_surf, score_rect)
-
-        # Draw top score at top-right
-        top_surf = self.font.render(f"Top: {self.highscore_name} {self.highscore_score}", True, (255, 255, 0))
-        top_rect = top_surf.get_rect()
-        top_rect.top = 6
-        top_rect.right = WINDOW_W - 8
-        self.screen.blit(top_surf, top_rect)
+            self._top_rect = self._top_surf.get_rect()
+            self._top_rect.top = 6
+            self._top_rect.right = WINDOW_W - 8
+            self._top_surf_for = hs
+            if self.renderer is not None:
+                self._top_tex = Texture.from_surface(self.renderer, self._top_surf)
+
+    def cell_rect(self, pos: Position) -> pygame.Rect:
+        """Screen rectangle covered by the board cell pos – shared, don't modify it."""
+        return self._rects[pos]
+
+    def redraw_area(self, rect: pygame.Rect):
+        """Repaint background, snake and food underneath rect (without the text)."""
+        self.screen.set_clip(rect)
+        self.screen.fill((0, 0, 0))
+        for r in range(rect.top // CELL_SIZE, (rect.bottom - 1) // CELL_SIZE + 1):
+            for c in range(rect.left // CELL_SIZE, (rect.right - 1) // CELL_SIZE + 1):
+                cell = enc(r, c)
+                if cell == self.food:
+                    self.screen.blit(self._food_surf, self.cell_rect(cell))
+                elif self.occupied[cell]:
+                    self.screen.blit(self._cell_surf, self.cell_rect(cell))
+        self.screen.set_clip(None)
 
     # --------------------------------------------------------------------- #
     # Highscore persistence & game-over handling
     # --------------------------------------------------------------------- #
     def highscore_path(self) -> str:
-        return os.path.join(os.path.dirname(__file__), "highscore.json")
+        return self._highscore_path
 
     def load_highscore(self) -> tuple:
         path = self.highscore_path()
@@ -225,130 +517,81 @@ class SnakeGame:
 
     def save_highscore(self, name: str, score: int) -> None:
         path = self.highscore_path()
+        tmp = path + ".tmp"
+        data = json.dumps({"name": name, "score": int(score)})
         try:
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump({"name": name, "score": int(score)}, f)
+            # write a temporary file and swap it in, so a crash mid-write can't
+            # leave a truncated highscore.json behind
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
         except Exception:
-            # ignore save errors silently
-            pass
+            # ignore save errors silently, but don't leave the temp file behind
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
 
     def handle_game_over(self):
         """Prompt the user for a name and save high score only if beaten."""
         pygame.event.clear()
         name = ""
         prompt = "Enter name (press Enter to confirm):"
-        clock = pygame.time.Clock()
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        if name == "":
-                            name = "Player"
-                        # only save if beat top
-                        if self.score > self.highscore_score:
-                            self.save_highscore(name, self.score)
-                            self.highscore_name, self.highscore_score = name, self.score
-                        return
-                    elif event.key == pygame.K_BACKSPACE:
-                        name = name[:-1]
-                    else:
-                        # ignore non-character control keys
-                        if len(event.unicode) == 1 and event.unicode.isprintable():
-                            name += event.unicode
-
-            # draw prompt
-            self.screen.fill((0, 0, 0))
-            go_surf = self.font.render("Game Over", True, (255, 0, 0))
-            go_rect = go_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 - 40))
-            self.screen.blit(go_surf, go_rect)
-
-            score_surf = self.font.render(f"Your score: {self.score}", True, (255, 255, 255))
-            score_rect = score_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 - 10))
-            self.screen.blit(score_surf, score_rect)
-
-            prompt_surf = self.font.render(prompt, True, (200, 200, 200))
-            prompt_rect = prompt_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 + 20))
-            self.screen.blit(prompt_surf, prompt_rect)
-
-            name_surf = self.font.render(name + ("_" if (pygame.time.get_ticks() // 500) % 2 == 0 else ""), True, (255, 255, 255))
-            name_rect = name_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 + 50))
-            self.screen.blit(name_surf, name_rect)
 
-            pygame.display.flip()
-            clock.tick(30)
-
-        # ... (existing imports and constants)
-
-    class MultiplayerSnakeGame:
-        def __init__(self):
-        # ... (existing initialization code)
-            self.players = []  # List of Player objects
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.bind(('localhost', 12345))
-            self.server_socket.listen(4)  # Allow up to 4 connections
-
-        def run(self):
-        # ... (existing run method code)
-            running = True
-            while running:
-            # Handle incoming connections and player inputs
-                for conn, addr in self.server_socket.accept():
-                    player = Player(conn)
-                    self.players.append(player)
-
-            # Update game state based on player inputs
-                for player in self.players:
-                    if player.input_ready:
-                        direction = player.get_direction()
-                    # Update player's position and check for collisions
-                    # ...
-
-            # Draw the game state
-            self.draw()
-
-            # Refresh screen & tick
-            pygame.display.flip()
-            self.clock.tick(self.current_fps)
+        # the static lines never change while the prompt is open
+        go_surf = self.font.render("Game Over", True, (255, 0, 0))
+        go_rect = go_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 - 40))
+        score_surf = self.font.render(f"Your score: {self.score}", True, (255, 255, 255))
+        score_rect = score_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 - 10))
+        prompt_surf = self.font.render(prompt, True, (200, 200, 200))
+        prompt_rect = prompt_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 + 20))
+
+        # Sleep until a key is pressed or the cursor should blink, instead of
+        # redrawing the prompt 30 times a second
+        cursor_on = True
+        pygame.time.set_timer(CURSOR_EVENT, 500)
+        try:
+            while True:
+                # draw prompt
+                self.screen.fill((0, 0, 0))
+                self.screen.blit(go_surf, go_rect)
+                self.screen.blit(score_surf, score_rect)
+                self.screen.blit(prompt_surf, prompt_rect)
 
-        # Handle game over
-            self.handle_game_over()
+                name_surf = self.font.render(name + ("_" if cursor_on else ""), True, (255, 255, 255))
+                name_rect = name_surf.get_rect(center=(WINDOW_W // 2, WINDOW_H // 2 + 50))
+                self.screen.blit(name_surf, name_rect)
 
-    def spawn_food(self):
-        # ... (existing spawn_food method code)
-
-        def draw(self):
-            """Draw the multiplayer game state to the screen."""
-        # Clear background
-            self.screen.fill((0, 0, 0))
-
-        # Draw each player's snake
-        for player in self.players:
-            for r, c in player.snake:
-                pygame.draw.rect(
-                    self.screen,
-                    (0, 255, 0),  # green
-                    pygame.Rect(c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-                )
-
-        # Draw food
-        if self.food:
-            pygame.draw.rect(
-                self.screen,
-                (255, 0, 0),  # red
-                pygame.Rect(self.food[1] * CELL_SIZE, self.food[0] * CELL_SIZE, CELL_SIZE, CELL_SIZE)
-            )
+                self.present_screen()
 
-class Player:
-    def __init__(self, conn):
-        self.conn = conn
-        self.input_ready = False
+                # wait for something that changes what is on screen
+                while True:
+                    event = pygame.event.wait()
+                    if event.type in (pygame.QUIT, pygame.KEYDOWN, CURSOR_EVENT):
+                        break
 
-    def get_direction(self):
-        # Read direction from the client connection
-        # ...
-        return direction
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == CURSOR_EVENT:
+                    cursor_on = not cursor_on
+                elif event.key == pygame.K_RETURN:
+                    if name == "":
+                        name = "Player"
+                    # only save if beat top
+                    if self.score > self.highscore_score:
+                        self.save_highscore(name, self.score)
+                        self.highscore_name, self.highscore_score = name, self.score
+                    return
+                elif event.key == pygame.K_BACKSPACE:
+                    name = name[:-1]
+                else:
+                    # ignore non-character control keys
+                    if len(event.unicode) == 1 and event.unicode.isprintable():
+                        name += event.unicode
+        finally:
+            pygame.time.set_timer(CURSOR_EVENT, 0)
 
 
 # --------------------------------------------------------------------------- #